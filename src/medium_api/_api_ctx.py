@@ -0,0 +1,24 @@
+"""
+Internal module holding `ApiCtx`, the bundle of callables that `Medium`
+threads into every child object (`Article`, `User`, `Publication`, etc ...).
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class ApiCtx:
+    """One immutable bundle of the `Medium`-bound callables shared by all
+    child objects, passed by reference instead of as separate arguments.
+
+    Note:
+        `ApiCtx` class is NOT intended to be used directly by importing.
+        It is created once per `Medium` instance.
+
+    """
+    __slots__ = ('get_resp', 'get_resps', 'fetch_articles', 'fetch_users')
+
+    get_resp: Callable
+    get_resps: Callable
+    fetch_articles: Callable
+    fetch_users: Callable
@@ -27,11 +27,9 @@ class Article:
         See :obj:`medium_api.medium.Medium.article`.
 
     """
-    def __init__(self, article_id, get_resp, fetch_articles, fetch_users, save_info=False):
-        self.__get_resp = get_resp
+    def __init__(self, article_id, ctx, save_info=False):
+        self.__ctx = ctx
         self.article_id = str(article_id)
-        self.__fetch_articles = fetch_articles
-        self.__fetch_users = fetch_users
 
         self.title = None
         self.subtitle = None
@@ -94,10 +92,8 @@ class Article:
         self.title = article['title']
         self.subtitle = article['subtitle']
         self.claps = article['claps']
-        self.author = User(user_id=article['author'], 
-                           get_resp=self.__get_resp, 
-                           fetch_articles=self.__fetch_articles,
-                           fetch_users=self.__fetch_users,
+        self.author = User(user_id=article['author'],
+                           ctx=self.__ctx,
                            save_info=False)
         self.url = article['url']
         self.published_at = datetime.strptime(article['published_at'], '%Y-%m-%d %H:%M:%S')
@@ -113,10 +109,8 @@ class Article:
         self.image_url = article['image_url']
 
         if not self.is_self_published:
-            self.publication = Publication(publication_id=self.publication_id, 
-                                           get_resp=self.__get_resp,
-                                           fetch_articles=self.__fetch_articles,
-                                           fetch_users=self.__fetch_users,
+            self.publication = Publication(publication_id=self.publication_id,
+                                           ctx=self.__ctx,
                                            save_info=False)
 
 
@@ -162,7 +156,7 @@ class Article:
         
         """
         if self.__info is None:
-            resp, _ = self.__get_resp(f'/article/{self.article_id}')
+            resp, _ = self.__ctx.get_resp(f'/article/{self.article_id}')
             self.__info = dict(resp)
         
         return self.__info
@@ -175,7 +169,7 @@ class Article:
             list: Returns a list of `response_ids`.
         """
         if self.__response_ids is None:
-            resp, _ = self.__get_resp(f'/article/{self.article_id}/responses')
+            resp, _ = self.__ctx.get_resp(f'/article/{self.article_id}/responses')
             self.__response_ids = list(resp['responses'])
         
         return self.__response_ids
@@ -188,12 +182,7 @@ class Article:
             list[Article]: Returns a list of `Article` Objects.
         """
         if self.__responses is None:
-            self.__responses = [Article(
-                                    article_id=response_id, 
-                                    get_resp=self.__get_resp, 
-                                    fetch_articles=self.__fetch_articles,
-                                    fetch_users=self.__fetch_users,
-                                )
+            self.__responses = [Article(article_id=response_id, ctx=self.__ctx)
                                 for response_id in self.response_ids]
 
         return self.__responses
@@ -211,7 +200,7 @@ class Article:
             ``article.responses[0].content``
             ``article.responses[1].claps``
         """
-        self.__fetch_articles(self.responses, content=content)
+        self.__ctx.fetch_articles(self.responses, content=content)
 
 
     @property
@@ -237,7 +226,7 @@ class Article:
             image captions, listicles, etc ...` within an article 
         """
         if self.__content is None:
-            resp, _ = self.__get_resp(f'/article/{self.article_id}/content')
+            resp, _ = self.__ctx.get_resp(f'/article/{self.article_id}/content')
             self.__content = str(resp['content'])
 
         return self.__content
@@ -251,7 +240,7 @@ class Article:
             images, listicles, etc ...` within an article, in the markdown format 
         """
         if self.__markdown is None:
-            resp, _ = self.__get_resp(f'/article/{self.article_id}/markdown')
+            resp, _ = self.__ctx.get_resp(f'/article/{self.article_id}/markdown')
             self.__markdown = str(resp['markdown'])
 
         return self.__markdown
@@ -17,11 +17,9 @@ class LatestPosts:
         See :obj:`medium_api.medium.Medium.latestposts`.
 
     """
-    def __init__(self, topic_slug, get_resp, fetch_articles, fetch_users):
+    def __init__(self, topic_slug, ctx):
         self.topic_slug = str(topic_slug)
-        self.__get_resp = get_resp
-        self.__fetch_articles = fetch_articles
-        self.__fetch_users = fetch_users
+        self.__ctx = ctx
 
         self.__ids = None
         self.__posts = None
@@ -34,7 +32,7 @@ class LatestPosts:
             list[str]: Returns a list of article ids (str).
         """
         if self.__ids is None:
-            resp, _ = self.__get_resp(f'/latestposts/{self.topic_slug}')
+            resp, _ = self.__ctx.get_resp(f'/latestposts/{self.topic_slug}')
             try:
                 self.__ids = list(resp['latestposts'])
             except KeyError:
@@ -54,11 +52,8 @@ class LatestPosts:
         from medium_api._article import Article
 
         if self.__posts is None:
-            self.__posts = [Article(article_id=article_id, 
-                                    get_resp=self.__get_resp, 
-                                    fetch_articles=self.__fetch_articles,
-                                    fetch_users = self.__fetch_users,
-                                    save_info=False) 
+            self.__posts = [Article(article_id=article_id, ctx=self.__ctx,
+                                    save_info=False)
                             for article_id in self.ids]
 
         return self.__posts 
@@ -81,4 +76,4 @@ class LatestPosts:
             ``latestposts.articles[0].title``
             ``latestposts.articles[1].claps``
         """
-        self.__fetch_articles(self.articles, max_len=max_len, content=content, markdown=markdown)
\ No newline at end of file
+        self.__ctx.fetch_articles(self.articles, max_len=max_len, content=content, markdown=markdown)
\ No newline at end of file
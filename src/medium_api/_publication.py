@@ -1,9 +1,36 @@
 """
 Publication Module
 """
-from functools import lru_cache
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
+from operator import itemgetter
 from medium_api._user import User
+
+# Number of `articles` windows fetched concurrently per batch while
+# paginating through a datetime range.
+_PREFETCH_WINDOWS = 8
+
+# Number of (_from, _to) results remembered per Publication instance.
+_RANGE_CACHE_SIZE = 16
+
+# C-level single-call extractors for the fields stored by `save_info`.
+_NEWSLETTER_FIELDS = itemgetter('id', 'name', 'subscribers', 'slug',
+                                'description', 'image', 'creator_id')
+_PUBLICATION_FIELDS = itemgetter('name', 'description', 'url', 'tagline',
+                                 'followers', 'slug', 'tags', 'domain',
+                                 'twitter_username', 'instagram_username',
+                                 'facebook_pagename')
+
+_Article = None
+
+def _article_cls():
+    # Resolved lazily (and only once) to avoid a circular import with
+    # medium_api._article at module load.
+    global _Article
+    if _Article is None:
+        from medium_api._article import Article
+        _Article = Article
+    return _Article
 class Newsletter:
     """Newsletter Class
     
@@ -19,11 +46,12 @@ class Newsletter:
         See :obj:`medium_api.medium.Medium.publication.newsletter`.
 
     """
-    def __init__(self, publication_id, get_resp, fetch_articles, fetch_users, save_info=False):
+    __slots__ = ('publication_id', '__ctx', '__info', 'id', 'name', 'subscribers',
+                 'slug', 'description', 'image_url', 'creator')
+
+    def __init__(self, publication_id, ctx, save_info=False):
         self.publication_id = publication_id
-        self.__get_resp = get_resp
-        self.__fetch_articles = fetch_articles
-        self.__fetch_users = fetch_users
+        self.__ctx = ctx
 
         self.__info = None
 
@@ -40,7 +68,7 @@ class Newsletter:
         
         """
         if self.__info is None:
-            resp, _ = self.__get_resp(f'/publication/{self.publication_id}/newsletter')
+            resp, _ = self.__ctx.get_resp(f'/publication/{self.publication_id}/newsletter')
             self.__info = dict(resp)
 
         return self.__info
@@ -63,18 +91,10 @@ class Newsletter:
         """
         newsletter = self.info
 
-        self.id = newsletter['id']
-        self.name = newsletter['name']
-        self.subscribers = newsletter['subscribers']
-        self.slug = newsletter['slug']
-        self.description = newsletter['description']
-        self.image_url = newsletter['image']
-        
-        self.creator = User(user_id=newsletter['creator_id'], 
-                            get_resp=self.__get_resp, 
-                            fetch_articles=self.__fetch_articles, 
-                            fetch_users=self.__fetch_users
-                        )
+        (self.id, self.name, self.subscribers, self.slug,
+         self.description, self.image_url, creator_id) = _NEWSLETTER_FIELDS(newsletter)
+
+        self.creator = User(user_id=creator_id, ctx=self.__ctx)
 
 class Publication:
     """Publication Class
@@ -83,6 +103,7 @@ class Publication:
 
         - publication._id
         - publication.info
+        - publication.article_ids
         - publication.articles
         - publication.save_info()
         - publication.fetch_articles()
@@ -92,11 +113,15 @@ class Publication:
         See :obj:`medium_api.medium.Medium.publication`.
 
     """
-    def __init__(self, publication_id, get_resp, fetch_articles, fetch_users, save_info=False):
+    __slots__ = ('publication_id', '__ctx', 'name', 'description', 'url', 'tagline',
+                 'followers', 'slug', 'tags', 'creator', 'editors', 'domain',
+                 'twitter_username', 'instagram_username', 'facebook_pagename',
+                 '__newsletter', '__info', '__article_ids', '__articles',
+                 '__range_cache', '__range_cache_order')
+
+    def __init__(self, publication_id, ctx, save_info=False):
         self.publication_id = str(publication_id)
-        self.__get_resp = get_resp
-        self.__fetch_articles = fetch_articles
-        self.__fetch_users = fetch_users
+        self.__ctx = ctx
 
         self.name = None
         self.description = None
@@ -112,17 +137,16 @@ class Publication:
         self.instagram_username = None
         self.facebook_pagename = None
 
-        self.newsletter = Newsletter(publication_id=publication_id, 
-                                     get_resp = self.__get_resp,
-                                     fetch_articles = self.__fetch_articles,
-                                     fetch_users = self.__fetch_users,
-                                     save_info=False)
+        self.__newsletter = None
 
         self.__info = None
 
-        #self.__article_ids = None
+        self.__article_ids = None
         self.__articles = None
 
+        self.__range_cache = {}
+        self.__range_cache_order = deque(maxlen=_RANGE_CACHE_SIZE)
+
         if save_info:
             self.save_info()
 
@@ -136,17 +160,32 @@ class Publication:
         """
         return self.publication_id
 
+    @property
+    def newsletter(self):
+        """To get the publication's `Newsletter` object
+
+        Returns:
+            Newsletter: The `Newsletter` object of the publication. (Created
+            on first access.)
+
+        """
+        if self.__newsletter is None:
+            self.__newsletter = Newsletter(publication_id=self.publication_id,
+                                           ctx=self.__ctx, save_info=False)
+
+        return self.__newsletter
+
     @property
     def info(self):
         """To get the publication related information
-        
+
         Returns:
             dict: A dictionary object containing `name, slug, followers,
             description, tagline, url, twitter_username, tags, etc ...`
-        
+
         """
         if self.__info is None:
-            resp, _ = self.__get_resp(f'/publication/{self._id}')
+            resp, _ = self.__ctx.get_resp(f'/publication/{self._id}')
             self.__info = dict(resp)
 
         return self.__info
@@ -175,31 +214,17 @@ class Publication:
         """
         publication = self.info
 
-        self.name = publication['name']
-        self.description = publication['description']
-        self.url = publication['url']
-        self.tagline = publication['tagline']
-        self.followers = publication['followers']
-        self.slug = publication['slug']
-        self.tags = publication['tags']
-        self.domain = publication['domain']
-        self.twitter_username = publication['twitter_username']
-        self.instagram_username = publication['instagram_username']
-        self.facebook_pagename = publication['facebook_pagename']
-
-        self.creator = User(user_id=publication['creator'], 
-                            get_resp=self.__get_resp, 
-                            fetch_articles=self.__fetch_articles, 
-                            fetch_users=self.__fetch_users, 
-                            save_info=True
-                        )
-
-        self.editors = [User(user_id=editor_id, 
-                            get_resp=self.__get_resp, 
-                            fetch_articles=self.__fetch_articles, 
-                            fetch_users=self.__fetch_users, 
-                            save_info=True
-                        ) for editor_id in publication['editors']]
+        (self.name, self.description, self.url, self.tagline, self.followers,
+         self.slug, self.tags, self.domain, self.twitter_username,
+         self.instagram_username, self.facebook_pagename) = _PUBLICATION_FIELDS(publication)
+
+        self.creator = User(user_id=publication['creator'], ctx=self.__ctx,
+                            save_info=False)
+
+        self.editors = [User(user_id=editor_id, ctx=self.__ctx, save_info=False)
+                        for editor_id in publication['editors']]
+
+        self.__ctx.fetch_users([self.creator] + self.editors)
     
    
     def articles_from_ids(self, article_ids):
@@ -212,18 +237,12 @@ class Publication:
             list[Article]: Returns a list of Article Objects.
 
         """
-        from medium_api._article import Article
+        Article = _article_cls()
 
-        return [Article(
-                        article_id=article_id, 
-                        get_resp=self.__get_resp, 
-                        fetch_articles=self.__fetch_articles,
-                        fetch_users = self.__fetch_users,
-                    )
+        return [Article(article_id=article_id, ctx=self.__ctx)
                 for article_id in article_ids]
     
     
-    @lru_cache(maxsize=16)
     def get_articles_between(self, _from=None, _to=None):
         """To get publication articles within a datetime range.
 
@@ -253,32 +272,105 @@ class Publication:
         """
         if _from is None:
             _from = datetime.now()
-        
+
+        key = (_from, _to)
+        if key in self.__range_cache:
+            return self.__range_cache[key]
+
         if _from and _to:
             if _to < _from:
-                resp,_ = self.__get_resp(f'/publication/{self._id}/articles?from={_from.isoformat()}')
-                articles = self.articles_from_ids(resp['publication_articles'][::-1])
-                next_to = datetime.strptime(resp['to'], '%Y-%m-%d %H:%M:%S')
+                resp,_ = self.__ctx.get_resp(f'/publication/{self._id}/articles?from={_from.isoformat()}')
+                articles = self.articles_from_ids(reversed(resp['publication_articles']))
+                next_to = datetime.fromisoformat(resp['to'])
 
-                while next_to > _to:
-                    resp,_ = self.__get_resp(f'/publication/{self._id}/articles?from={next_to.isoformat()}')
-                    articles += self.articles_from_ids(resp['publication_articles'][::-1])
-                    next_to = datetime.strptime(resp['to'], '%Y-%m-%d %H:%M:%S')
-            
-                self.__fetch_articles(articles)
+                stride = _from - next_to
+                seen_ids = set(article._id for article in articles)
 
-                self.__articles = [article for article in articles if (_to <= article.published_at <= _from)]
+                while next_to > _to:
+                    if stride > timedelta(0):
+                        # Fire a batch of window fetches concurrently. The first
+                        # window starts exactly at `next_to`; the rest are
+                        # speculative, assuming windows keep roughly the same
+                        # duration as the ones already observed.
+                        n_windows = min(_PREFETCH_WINDOWS, int((next_to - _to) / stride) + 1)
+                        windows = [next_to - (i * stride) for i in range(n_windows)]
+                        resps = self.__ctx.get_resps([f'/publication/{self._id}/articles?from={window.isoformat()}'
+                                                      for window in windows])
+
+                        batch_start = next_to
+                        accepted = 0
+
+                        for window_from, (resp, _) in zip(windows, resps):
+                            if window_from < next_to:
+                                # The prediction overshot and left a gap before
+                                # this window; discard it (and the rest) and
+                                # resume from the real boundary.
+                                break
+
+                            article_ids = [article_id for article_id in reversed(resp['publication_articles'])
+                                           if article_id not in seen_ids]
+                            seen_ids.update(article_ids)
+                            articles.extend(self.articles_from_ids(article_ids))
+                            next_to = datetime.fromisoformat(resp['to'])
+                            accepted += 1
+
+                            if next_to <= _to:
+                                break
+
+                        if accepted and next_to < batch_start:
+                            # Re-estimate the window duration from what this
+                            # batch actually covered, so the next round of
+                            # predictions tracks drift in the publication's
+                            # posting frequency.
+                            stride = (batch_start - next_to) / accepted
+                    else:
+                        resp,_ = self.__ctx.get_resp(f'/publication/{self._id}/articles?from={next_to.isoformat()}')
+                        articles.extend(self.articles_from_ids(reversed(resp['publication_articles'])))
+                        next_to = datetime.fromisoformat(resp['to'])
+
+                self.__ctx.fetch_articles(articles)
+
+                seen = set()
+                filtered = []
+                for article in articles:
+                    if article._id in seen:
+                        continue
+                    seen.add(article._id)
+                    if _to <= article.published_at <= _from:
+                        filtered.append(article)
+
+                self.__articles = filtered
 
             else:
                 print('[ERROR]: "from" date should be greater than "to" date. Try swapping both.')
                 return []
         else:
-            resp,_ = self.__get_resp(f'/publication/{self._id}/articles?from={_from.isoformat()}')
+            resp,_ = self.__ctx.get_resp(f'/publication/{self._id}/articles?from={_from.isoformat()}')
             self.__articles = self.articles_from_ids(resp['publication_articles'])
-            self.__fetch_articles(self.__articles)
-        
+            self.__ctx.fetch_articles(self.__articles)
+
+        if len(self.__range_cache_order) == _RANGE_CACHE_SIZE:
+            self.__range_cache.pop(self.__range_cache_order[0], None)
+        self.__range_cache_order.append(key)
+        self.__range_cache[key] = self.__articles
+
         return self.__articles
     
+    @property
+    def article_ids(self):
+        """To get the `article_ids` of the top recent 25 articles
+
+        Returns:
+            list[str]: A list of `article_ids` (str) of the publication's top
+            recent articles, without constructing `Article` objects.
+
+        """
+        if self.__article_ids is None:
+            resp, _ = self.__ctx.get_resp(f'/publication/{self._id}/articles')
+            self.__article_ids = list(resp['publication_articles'])
+
+        return self.__article_ids
+
     @property
     def articles(self):
         """Returns top recent 25 articles
@@ -292,6 +384,7 @@ class Publication:
             list[Article]: Returns a list of Article Objects
         """
         if self.__articles is None:
-            self.__articles = self.get_articles_between()
-        
+            self.__articles = self.articles_from_ids(self.article_ids)
+            self.__ctx.fetch_articles(self.__articles)
+
         return self.__articles
\ No newline at end of file
@@ -16,12 +16,9 @@ class TopWriters:
         See :obj:`medium_api.medium.Medium.top_writers`.
 
     """
-    def __init__(self, topic_slug, get_resp, fetch_users, fetch_articles):
+    def __init__(self, topic_slug, ctx):
         self.topic_slug = str(topic_slug)
-        self.__get_resp = get_resp
-        self.__fetch_users = fetch_users
-        self.__fetch_articles = fetch_articles
-        self.__fetch_users = fetch_users
+        self.__ctx = ctx
 
         self.__ids = None
         self.__users = None
@@ -35,7 +32,7 @@ class TopWriters:
         
         """
         if self.__ids is None:
-            resp, _ = self.__get_resp(f'/top_writers/{self.topic_slug}')
+            resp, _ = self.__ctx.get_resp(f'/top_writers/{self.topic_slug}')
             self.__ids = list(resp['top_writers'])
 
         return self.__ids
@@ -50,11 +47,7 @@ class TopWriters:
         from medium_api._user import User
 
         if self.__users is None:
-            self.__users = [User(user_id=user_id, 
-                                 get_resp=self.__get_resp,
-                                 fetch_articles=self.__fetch_articles,
-                                 fetch_users = self.__fetch_users,
-                                 save_info=False) 
+            self.__users = [User(user_id=user_id, ctx=self.__ctx, save_info=False)
                             for user_id in self.ids]
         
         return self.__users
@@ -71,4 +64,4 @@ class TopWriters:
             ``top_writers.users[0].fullname``
             ``top_writers.users[1].bio``
         """
-        self.__fetch_users(self.users, max_len=max_len)
\ No newline at end of file
+        self.__ctx.fetch_users(self.users, max_len=max_len)
\ No newline at end of file
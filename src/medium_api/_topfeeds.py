@@ -2,6 +2,17 @@
 topfeeds module containing `TopFeeds` class.
 """
 
+_Article = None
+
+def _article_cls():
+    # Resolved lazily (and only once) to avoid a circular import with
+    # medium_api._article at module load.
+    global _Article
+    if _Article is None:
+        from medium_api._article import Article
+        _Article = Article
+    return _Article
+
 class TopFeeds:
     """TopFeeds Class
     
@@ -16,12 +27,12 @@ class TopFeeds:
         See :obj:`medium_api.medium.Medium.topfeeds`.
 
     """
-    def __init__(self, tag, mode, get_resp, fetch_articles, fetch_users):
+    __slots__ = ('tag', 'mode', '__ctx', '__ids', '__articles')
+
+    def __init__(self, tag, mode, ctx):
         self.tag = str(tag)
         self.mode = str(mode)
-        self.__get_resp = get_resp
-        self.__fetch_articles = fetch_articles
-        self.__fetch_users = fetch_users
+        self.__ctx = ctx
 
         self.__ids = None
         self.__articles = None
@@ -36,7 +47,7 @@ class TopFeeds:
         
         """
         if self.__ids is None:
-            resp, _ = self.__get_resp(f'/topfeeds/{self.tag}/{self.mode}')
+            resp, _ = self.__ctx.get_resp(f'/topfeeds/{self.tag}/{self.mode}')
             self.__ids = list(resp['topfeeds'])
 
         return self.__ids
@@ -50,14 +61,11 @@ class TopFeeds:
             `tag` and `mode`.
         
         """
-        from medium_api._article import Article
+        Article = _article_cls()
 
         if self.__articles is None:
-            self.__articles = [Article(article_id=article_id, 
-                                       get_resp=self.__get_resp, 
-                                       fetch_articles=self.__fetch_articles,
-                                       fetch_users=self.__fetch_users,
-                                       save_info=False) 
+            self.__articles = [Article(article_id=article_id, ctx=self.__ctx,
+                                       save_info=False)
                                 for article_id in self.ids]
 
         return self.__articles
@@ -80,4 +88,4 @@ class TopFeeds:
             ``topfeeds.articles[0].title``
             ``topfeeds.articles[1].claps``
         """
-        self.__fetch_articles(self.articles, max_len=max_len, content=content, markdown=markdown)
\ No newline at end of file
+        self.__ctx.fetch_articles(self.articles, max_len=max_len, content=content, markdown=markdown)
\ No newline at end of file
@@ -30,11 +30,9 @@ class User:
         See :obj:`medium_api.medium.Medium.user`.
 
     """
-    def __init__(self, user_id, get_resp, fetch_articles, fetch_users, save_info=False):
+    def __init__(self, user_id, ctx, save_info=False):
         self.user_id = user_id
-        self.__get_resp = get_resp
-        self.__fetch_articles = fetch_articles
-        self.__fetch_users = fetch_users
+        self.__ctx = ctx
 
         self.__info = None
         self.__articles = None
@@ -83,7 +81,7 @@ class User:
         
         """
         if self.__info is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}')
+            resp, _ = self.__ctx.get_resp(f'/user/{self._id}')
             self.__info = dict(resp)
         
         return self.__info
@@ -97,7 +95,7 @@ class User:
         
         """
         if self.__article_ids is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}/articles')
+            resp, _ = self.__ctx.get_resp(f'/user/{self._id}/articles')
             self.__article_ids = list(resp['associated_articles'])
 
         return self.__article_ids
@@ -112,7 +110,7 @@ class User:
         
         """
         if self.__top_article_ids is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}/top_articles')
+            resp, _ = self.__ctx.get_resp(f'/user/{self._id}/top_articles')
             self.__top_article_ids = list(resp['top_articles'])
 
         return self.__top_article_ids
@@ -126,7 +124,7 @@ class User:
         
         """
         if self.__interests is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}/interests')
+            resp, _ = self.__ctx.get_resp(f'/user/{self._id}/interests')
             self.__interests = list(resp['tags_followed'])
         
         return self.__interests
@@ -140,7 +138,7 @@ class User:
         
         """
         if self.__following_ids is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}/following')
+            resp, _ = self.__ctx.get_resp(f'/user/{self._id}/following')
             self.__following_ids = list(resp['following'])
         
         return self.__following_ids
@@ -154,7 +152,7 @@ class User:
         
         """
         if self.__followers_ids is None:
-            resp, _ = self.__get_resp(f'/user/{self._id}/followers')
+            resp, _ = self.__ctx.get_resp(f'/user/{self._id}/followers')
             self.__followers_ids = list(resp['followers'])
         
         return self.__followers_ids
@@ -168,13 +166,9 @@ class User:
         
         """
         if self.__following is None:
-            self.__following = [User(
-                                    user_id = user_id,
-                                    get_resp = self.__get_resp,
-                                    fetch_articles = self.__fetch_articles,
-                                    fetch_users = self.__fetch_users,
-                                    save_info = False
-                              ) for user_id in self.following_ids]
+            self.__following = [User(user_id = user_id, ctx = self.__ctx,
+                                     save_info = False)
+                                for user_id in self.following_ids]
         
         return self.__following
 
@@ -187,13 +181,9 @@ class User:
         
         """
         if self.__followers is None:
-            self.__followers = [User(
-                                    user_id = user_id,
-                                    get_resp = self.__get_resp,
-                                    fetch_articles = self.__fetch_articles,
-                                    fetch_users = self.__fetch_users,
-                                    save_info = False
-                              ) for user_id in self.followers_ids]
+            self.__followers = [User(user_id = user_id, ctx = self.__ctx,
+                                     save_info = False)
+                                for user_id in self.followers_ids]
         
         return self.__followers
 
@@ -206,7 +196,7 @@ class User:
             ``user.following[0].fullname``
             ``user.following[1].bio``
         """
-        self.__fetch_users(self.following)
+        self.__ctx.fetch_users(self.following)
 
     def fetch_followers(self):
         """To user's followers information
@@ -217,7 +207,7 @@ class User:
             ``user.followers[0].fullname``
             ``user.followers[1].bio``
         """
-        self.__fetch_users(self.followers)
+        self.__ctx.fetch_users(self.followers)
         
     @property
     def articles(self):
@@ -230,11 +220,7 @@ class User:
         from medium_api._article import Article
 
         if self.__articles is None:
-            self.__articles = [Article(i, 
-                                    get_resp = self.__get_resp, 
-                                    fetch_articles=self.__fetch_articles, 
-                                    fetch_users = self.__fetch_users,
-                                    save_info=False) 
+            self.__articles = [Article(i, ctx = self.__ctx, save_info=False)
                             for i in self.article_ids]
             
         return self.__articles
@@ -251,11 +237,7 @@ class User:
         from medium_api._article import Article
 
         if self.__top_articles is None:
-            self.__top_articles = [Article(i, 
-                                           get_resp = self.__get_resp, 
-                                           fetch_articles=self.__fetch_articles, 
-                                           fetch_users=self.__fetch_users,
-                                           save_info=False) 
+            self.__top_articles = [Article(i, ctx = self.__ctx, save_info=False)
                                     for i in self.top_article_ids]
             
         return self.__top_articles
@@ -329,7 +311,7 @@ class User:
             ``user.articles[0].title``
             ``user.articles[1].claps``
         """
-        self.__fetch_articles(self.articles, max_len=max_len, content=content, markdown=markdown)
+        self.__ctx.fetch_articles(self.articles, max_len=max_len, content=content, markdown=markdown)
 
     def fetch_top_articles(self, content=False):
         """To fetch top 10 user-written top articles information and content
@@ -344,5 +326,5 @@ class User:
             ``user.top_articles[0].title``
             ``user.top_articles[1].claps``
         """
-        self.__fetch_articles(self.top_articles, content=content)
+        self.__ctx.fetch_articles(self.top_articles, content=content)
 
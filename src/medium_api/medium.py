@@ -6,11 +6,14 @@ different functions provided in it.
 
 import time
 import re
+import asyncio
 from urllib.parse import urlparse
-from http.client import HTTPSConnection
-from ujson import loads
+from orjson import loads
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import httpx
+
+from medium_api._api_ctx import ApiCtx
 from medium_api._topfeeds import TopFeeds
 from medium_api._user import User
 from medium_api._article import Article
@@ -18,6 +21,15 @@ from medium_api._publication import Publication
 from medium_api._top_writers import TopWriters
 from medium_api._latestposts import LatestPosts
 
+# Upper bound on in-flight requests per __get_resps batch, so wide batches
+# stay within the API's rate limits instead of triggering throttling.
+_MAX_CONCURRENT_REQUESTS = 20
+
+# Transient HTTP statuses worth retrying, and the base of the exponential
+# backoff (0.3s, 0.6s, 1.2s ...) applied between attempts.
+_RETRY_STATUS_CODES = (500, 502, 503, 504)
+_RETRY_BACKOFF = 0.3
+
 class Medium:
     """Main Medium API Class to access everything
 
@@ -61,20 +73,49 @@ class Medium:
         }
         self.base_url = base_url
         self.calls = calls
+        self.__limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        self.__session = httpx.Client(base_url=f'https://{self.base_url}',
+                                      headers=self.headers,
+                                      limits=self.__limits)
+        self.__etag_cache = {}
+        self.__ctx = ApiCtx(get_resp = self.__get_resp,
+                            get_resps = self.__get_resps,
+                            fetch_articles = self.fetch_articles,
+                            fetch_users = self.fetch_users)
 
     def __get_resp(self, endpoint:str, retries:int=0):
-        conn = HTTPSConnection(self.base_url)
-        conn.request('GET', endpoint, headers=self.headers)
-        resp = conn.getresponse()
+        cached = self.__etag_cache.get(endpoint)
+        headers = {'If-None-Match': cached[0]} if cached else None
+
+        try:
+            resp = self.__session.get(endpoint, headers=headers)
+        except httpx.TransportError as e:
+            if retries < 3:
+                time.sleep(_RETRY_BACKOFF * (2 ** retries))
+                return self.__get_resp(endpoint=endpoint, retries=retries+1)
+            else:
+                print(f'[ERROR]: Transport Error: {e}')
+                return {}, None
+
+        data = resp.content
+        status = resp.status_code
+
+        if status in _RETRY_STATUS_CODES and retries < 3:
+            time.sleep(_RETRY_BACKOFF * (2 ** retries))
+            return self.__get_resp(endpoint=endpoint, retries=retries+1)
+
+        if status == 304 and cached is not None:
+            self.calls += 1
+            return cached[1], 200
 
-        data = resp.read()
-        status = resp.status
-        
         if status == 200:
             self.calls += 1
             json_data = loads(data)
 
             if not 'error' in json_data.keys():
+                etag = resp.headers.get('etag')
+                if etag:
+                    self.__etag_cache[endpoint] = (etag, json_data)
                 return json_data, status
             else:
                 if retries < 3:
@@ -88,6 +129,58 @@ class Medium:
             print(f'[ERROR]: Response: {data}')
             return {}, status
 
+    async def __get_resp_async(self, endpoint:str, client, retries:int=0):
+        try:
+            resp = await client.get(endpoint)
+        except httpx.TransportError as e:
+            if retries < 3:
+                await asyncio.sleep(_RETRY_BACKOFF * (2 ** retries))
+                return await self.__get_resp_async(endpoint=endpoint, client=client, retries=retries+1)
+            else:
+                print(f'[ERROR]: Transport Error: {e}')
+                return {}, None
+
+        data = resp.content
+        status = resp.status_code
+
+        if status in _RETRY_STATUS_CODES and retries < 3:
+            await asyncio.sleep(_RETRY_BACKOFF * (2 ** retries))
+            return await self.__get_resp_async(endpoint=endpoint, client=client, retries=retries+1)
+
+        if status == 200:
+            self.calls += 1
+            json_data = loads(data)
+
+            if not 'error' in json_data.keys():
+                return json_data, status
+            else:
+                if retries < 3:
+                    await asyncio.sleep(5)
+                    return await self.__get_resp_async(endpoint=endpoint, client=client, retries=retries+1)
+                else:
+                    print(f'[ERROR]: Response: {json_data}')
+                    return {}, status
+        else:
+            print(f'[ERROR]: Status Code: {status}')
+            print(f'[ERROR]: Response: {data}')
+            return {}, status
+
+    def __get_resps(self, endpoints:list):
+        async def gather_all():
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+            async def bounded(endpoint):
+                async with semaphore:
+                    return await self.__get_resp_async(endpoint, client)
+
+            async with httpx.AsyncClient(base_url=f'https://{self.base_url}',
+                                         headers=self.headers,
+                                         limits=self.__limits) as client:
+                return await asyncio.gather(*[bounded(endpoint)
+                                              for endpoint in endpoints])
+
+        return asyncio.run(gather_all())
+
     def user(self, username:str = None, user_id:str = None, save_info:bool = True):
         """For getting the Medium User Object
 
@@ -123,19 +216,11 @@ class Medium:
             cannot omit both. 
         """
         if user_id is not None:
-            return User(user_id = user_id, 
-                        get_resp = self.__get_resp, 
-                        fetch_articles=self.fetch_articles,
-                        fetch_users=self.fetch_users,
-                        save_info = save_info)
+            return User(user_id = user_id, ctx = self.__ctx, save_info = save_info)
         elif username is not None:
             resp, _ = self.__get_resp(f'/user/id_for/{str(username)}')
             user_id = resp['id']
-            return User(user_id = user_id, 
-                        get_resp = self.__get_resp, 
-                        fetch_articles=self.fetch_articles,
-                        fetch_users=self.fetch_users,
-                        save_info = save_info)
+            return User(user_id = user_id, ctx = self.__ctx, save_info = save_info)
         else:
             print('[ERROR]: Missing parameter: Please provide "user_id" or "username" to call the function')
             return None
@@ -162,11 +247,7 @@ class Medium:
             used to access all the properties and methods related to a Medium Article.
 
         """
-        return Article(article_id = article_id, 
-                       get_resp = self.__get_resp, 
-                       fetch_articles=self.fetch_articles,
-                       fetch_users = self.fetch_users,
-                       save_info = save_info)
+        return Article(article_id = article_id, ctx = self.__ctx, save_info = save_info)
 
     def publication(self, publication_slug:str = None, publication_id:str = None, save_info:bool = True):
         """For getting the Medium Publication Object
@@ -199,19 +280,13 @@ class Medium:
 
         """
         if publication_id is not None:
-            return Publication(publication_id = publication_id, 
-                        get_resp = self.__get_resp, 
-                        fetch_articles=self.fetch_articles,
-                        fetch_users=self.fetch_users,
+            return Publication(publication_id = publication_id, ctx = self.__ctx,
                         save_info = save_info)
 
         elif publication_slug is not None:
             resp, _ = self.__get_resp(f'/publication/id_for/{str(publication_slug)}')
             publication_id = resp['publication_id']
-            return Publication(publication_id = publication_id, 
-                        get_resp = self.__get_resp, 
-                        fetch_articles=self.fetch_articles,
-                        fetch_users=self.fetch_users,
+            return Publication(publication_id = publication_id, ctx = self.__ctx,
                         save_info = save_info)
         else:
             print('[ERROR]: Missing parameter: Please provide "publication_id" or "publication_slug" to call this function')
@@ -234,10 +309,7 @@ class Medium:
             Top Writers for the give `topic_slug`.
 
         """
-        return TopWriters(topic_slug=topic_slug, 
-                          get_resp=self.__get_resp, 
-                          fetch_users=self.fetch_users,
-                          fetch_articles=self.fetch_articles)
+        return TopWriters(topic_slug=topic_slug, ctx=self.__ctx)
 
     def latestposts(self, topic_slug:str):
         """For getting the Medium's LatestPosts Object
@@ -256,11 +328,7 @@ class Medium:
             LatestPosts within the given topic.
 
         """
-        return LatestPosts(topic_slug=topic_slug, 
-                           get_resp=self.__get_resp, 
-                           fetch_articles=self.fetch_articles,
-                           fetch_users=self.fetch_users,
-                        )
+        return LatestPosts(topic_slug=topic_slug, ctx=self.__ctx)
 
     def topfeeds(self, tag:str, mode:str):
         """For getting the Medium's TopFeeds Object
@@ -289,10 +357,7 @@ class Medium:
             and `mode`.
 
         """
-        return TopFeeds(tag=tag, mode=mode, 
-                        get_resp=self.__get_resp, 
-                        fetch_articles=self.fetch_articles,
-                        fetch_users=self.fetch_users)
+        return TopFeeds(tag=tag, mode=mode, ctx=self.__ctx)
 
     def related_tags(self, given_tag:str):
         """For getting the list of related tags
@@ -339,12 +404,14 @@ class Medium:
             list of Article(s) objects itself.
 
         """
+        targets = articles[:max_len]
+
         with ThreadPoolExecutor(max_workers=100) as executor:
-            future_to_url = [executor.submit(article.save_info) for article in articles[:max_len] if article.title is None]
+            future_to_url = [executor.submit(article.save_info) for article in targets if article.title is None]
             if content:
-                future_to_url += [executor.submit(article.save_content) for article in articles[:max_len]]
+                future_to_url += [executor.submit(article.save_content) for article in targets]
             if markdown:
-                future_to_url += [executor.submit(article.save_markdown) for article in articles[:max_len]]
+                future_to_url += [executor.submit(article.save_markdown) for article in targets]
 
             for future in as_completed(future_to_url):
                 future.result()
@@ -43,6 +43,12 @@ def test_publication_articles():
     assert isinstance(articles, list)
     assert len(articles)==0
 
+def test_publication_article_ids():
+    article_ids = _publication.article_ids
+
+    assert isinstance(article_ids, list)
+    assert isinstance(article_ids[0], str)
+
 def test_publication_info():
     _publication.save_info()
 